@@ -1 +1,70 @@
 """Configuration file for pytest."""
+
+import pathlib
+
+import pytest
+
+from zuulcilint.utils import ZuulObject
+
+ZUUL_JOB_YAML = """
+- job:
+    name: test-job
+    pre-run: playbooks/pre-run.yaml
+    run: playbooks/run.yaml
+    post-run: playbooks/post-run.yaml
+"""
+
+# One YAML body per Zuul object type, precomputed at import time so the
+# fixtures below only pay for a dict lookup per setup.
+ZUUL_OBJ_YAML_BODIES = {
+    obj_type: f"""
+- {obj_type.value}:
+    name: test-{obj_type.value}
+{ZUUL_JOB_YAML.lstrip()}"""
+    for obj_type in ZuulObject
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def libyaml_available():
+    """Guard against silently falling back to the pure-Python YAML loader."""
+    import yaml
+
+    assert hasattr(yaml, "CSafeLoader"), "libyaml bindings are required for the test suite"
+
+
+@pytest.fixture(scope="session")
+def zuul_job_yaml(tmp_path_factory):
+    """Create a session-scoped directory with a shared Zuul job YAML file.
+
+    Returns
+    -------
+        A Path object representing the directory holding 'job.yaml'.
+    """
+    tmp_path = tmp_path_factory.mktemp("zuul-job")
+    (tmp_path / "job.yaml").write_text(ZUUL_JOB_YAML, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def zuul_obj_yaml(tmp_path_factory):
+    """Return a session-scoped factory caching one Zuul object YAML file per type.
+
+    Returns
+    -------
+        A callable taking a ZuulObject and returning the directory holding
+        '<obj_type>.yaml'.
+    """
+    cache: dict[ZuulObject, pathlib.Path] = {}
+
+    def _setup(obj_type: ZuulObject) -> pathlib.Path:
+        if obj_type not in cache:
+            tmp_path = tmp_path_factory.mktemp(obj_type.value)
+            (tmp_path / f"{obj_type.value}.yaml").write_text(
+                ZUUL_OBJ_YAML_BODIES[obj_type],
+                encoding="utf-8",
+            )
+            cache[obj_type] = tmp_path
+        return cache[obj_type]
+
+    return _setup
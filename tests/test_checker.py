@@ -4,37 +4,15 @@ This module contains tests for the Zuul checker module.
 """
 
 import pathlib
-import tempfile
 
 import zuulcilint.checker as zuulcilint_checker
 import zuulcilint.utils as zuulcilint_utils
 from zuulcilint.utils import ZuulObject
 
 
-def setup_zuul_job_yaml():
-    """Create a temporary directory with a list of files.
-
-    Returns
-    -------
-        A Path object representing the temporary directory.
-    """
-    tmp_path = pathlib.Path(tempfile.mkdtemp())
-    with pathlib.Path.open(tmp_path / "job.yaml", "w", encoding="utf-8") as f:
-        f.write(
-            """
-            - job:
-                name: test-job
-                pre-run: playbooks/pre-run.yaml
-                run: playbooks/run.yaml
-                post-run: playbooks/post-run.yaml
-            """,
-        )
-    return tmp_path
-
-
-def test_check_job_playbook_paths():
+def test_check_job_playbook_paths(zuul_job_yaml):
     """Test that check_job_playbook_paths() returns a list of invalid paths."""
-    tmp_path = setup_zuul_job_yaml()
+    tmp_path = zuul_job_yaml
     jobs = zuulcilint_utils.get_zuul_object_from_yaml(ZuulObject.JOB, tmp_path / "job.yaml")
 
     assert zuulcilint_checker.check_job_playbook_paths(jobs[0].get(ZuulObject.JOB.value)) == [
@@ -80,6 +58,21 @@ def test_check_duplicated_jobs_no_duplicates():
     assert not zuulcilint_checker.check_duplicated_jobs(jobs)
 
 
+def test_check_duplicated_jobs_large_corpus():
+    """Test that duplicated_jobs() stays correct on a large job corpus."""
+    n_jobs = 10000
+    jobs = {
+        pathlib.Path("job1.yaml"): [{"job": {"name": f"job{i}"}} for i in range(n_jobs)],
+        pathlib.Path("job2.yaml"): [
+            {"job": {"name": "job0"}},
+            {"job": {"name": f"job{n_jobs - 1}"}},
+            {"job": {"name": "unique-job"}},
+        ],
+    }
+
+    assert zuulcilint_checker.check_duplicated_jobs(jobs) == {"job0", f"job{n_jobs - 1}"}
+
+
 def test_check_duplicated_jobs_empty_jobs():
     """Test that duplicated_jobs() returns an empty set when there are no jobs."""
     jobs = {}
@@ -6,10 +6,14 @@ A linter for Zuul configuration files.
 from __future__ import annotations
 
 import argparse
-import importlib.metadata
+import hashlib
+import json
+import os
 import pathlib
+import shelve
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 import yaml
 from jsonschema import Draft201909Validator
@@ -18,86 +22,262 @@ import zuulcilint.checker as zuul_checker
 import zuulcilint.utils as zuul_utils
 from zuulcilint.utils import MsgSeverity, ZuulObject
 
-# Register constructors for custom YAML tags
-yaml.SafeLoader.add_constructor(
-    "!encrypted/pkcs1-oaep",
-    zuul_utils.encrypted_pkcs1_oaep_constructor,
-)
-yaml.SafeLoader.add_constructor(
-    "!inherit",
-    zuul_utils.override_control_tags_constructor,
-)
-yaml.SafeLoader.add_constructor(
-    "!override",
-    zuul_utils.override_control_tags_constructor,
-)
-
-def lint(file_path: str, schema: dict) -> int:
-    """Validate a YAML file against a JSON schema.
+# Register constructors for custom YAML tags on both the pure-Python loader
+# and the libyaml-backed loader used by zuul_utils (a single class when
+# libyaml is not available).
+for loader in {yaml.SafeLoader, zuul_utils.SafeLoader}:
+    loader.add_constructor(
+        "!encrypted/pkcs1-oaep",
+        zuul_utils.encrypted_pkcs1_oaep_constructor,
+    )
+    loader.add_constructor(
+        "!inherit",
+        zuul_utils.override_control_tags_constructor,
+    )
+    loader.add_constructor(
+        "!override",
+        zuul_utils.override_control_tags_constructor,
+    )
+
+# Minimum number of files before lint_all_yaml_files spreads the work over
+# a process pool; below this the pool start-up cost outweighs the gain.
+MIN_FILES_FOR_POOL = 16
+
+# Per-process validator and options used by pool workers, set up once by the
+# initializer.
+_worker_validator = None
+_worker_fast_fail = False
+
+
+class _LazyVersionAction(argparse.Action):
+    """Print the package version, resolving it only when --version is used.
+
+    Looking the version up through importlib.metadata walks sys.path for
+    dist-info, which is wasted start-up work on every ordinary run.
+    """
+
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        import importlib.metadata
+
+        # Print to stdout like the stock version action (parser.exit's
+        # message argument would go to stderr).
+        print(importlib.metadata.version("zuulcilint"))
+        parser.exit()
+
+
+def _build_validator(schema: dict) -> Draft201909Validator:
+    """Build a schema validator with its lazy compilation state warmed up.
 
     Args:
     ----
-        file_path: A string representing the path to the YAML file to validate.
         schema: A JSON schema to validate against.
 
     Returns:
     -------
-        The number of validation errors encountered.
+        A ready-to-use Draft201909Validator.
     """
-    print(f"{file_path}")
-    errors = 0
-    validator = Draft201909Validator(schema)
+    # format_checker is disabled explicitly; format keywords are annotations
+    # here and skipping the checker avoids walking them per instance.
+    validator = Draft201909Validator(schema, format_checker=None)
+    # A throwaway validation forces the lazily-compiled subschema state to be
+    # built once instead of on the first real file.
+    validator.is_valid({})
+    return validator
+
+
+def _init_lint_worker(schema: dict, fast_fail: bool) -> None:
+    """Build the per-process validator for lint pool workers.
+
+    Args:
+    ----
+        schema: A JSON schema to validate against.
+        fast_fail: Whether to stop at the first validation error per file.
+
+    Returns:
+    -------
+        None.
+    """
+    global _worker_validator, _worker_fast_fail  # noqa: PLW0603
+    _worker_validator = _build_validator(schema)
+    _worker_fast_fail = fast_fail
+
+
+def _lint_worker(file_path: pathlib.Path) -> tuple[int, str, str]:
+    """Lint a single file inside a pool worker.
+
+    Args:
+    ----
+        file_path: The path to the YAML file to validate.
+
+    Returns:
+    -------
+        A tuple of the number of validation errors, the report text for
+        stdout and the error report text for stderr.
+    """
+    return lint(file_path, _worker_validator, fast_fail=_worker_fast_fail)
 
-    try:
-        with pathlib.Path.open(pathlib.Path(file_path), encoding="utf-8") as yaml_in:
-            try:
-                obj = yaml.safe_load(yaml_in)
-                va_errors = validator.iter_errors(obj)
-                for e in va_errors:
-                    zuul_utils.print_bold("Validation error:", MsgSeverity.ERROR)
-                    print(f"File: {file_path}")
-                    print(f"Message: {e.message}")
-                    print(f"Path: {list(e.path)}")
-                    print(f"Schema Path: {list(e.schema_path)}\n")
-                    errors += 1
-            except yaml.YAMLError as e:
-                print(f"YAML Parse Error: {e}")
-                errors += 1
-    except FileNotFoundError as e:
-        print(f"{e.filename} not found!\nExiting")
-        sys.exit(1)
 
-    return errors
+def _validation_cache_path() -> pathlib.Path:
+    """Return the path of the persistent validation cache, creating its directory.
 
+    Returns
+    -------
+        The path to the cache file (without shelve suffixes).
+    """
+    cache_home = pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache"))
+    cache_dir = cache_home / "zuulcilint"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir / "validations"
 
-def lint_single_yaml_file(file_path: pathlib.Path, schema: dict) -> int:
-    """Lint a single Zuul YAML file.
+
+def lint(
+    file_path: str,
+    validator: Draft201909Validator,
+    fast_fail: bool = False,
+) -> tuple[int, str, str]:
+    """Validate a YAML file against a JSON schema.
 
     Args:
     ----
         file_path: A string representing the path to the YAML file to validate.
-        schema: A JSON schema to validate against.
+        validator: A jsonschema validator to validate against.
+        fast_fail: Whether to stop at the first validation error.
 
     Returns:
     -------
-        The number of validation errors encountered.
+        A tuple of the number of validation errors, the report text for stdout
+        and the error report text for stderr.
     """
-    return lint(file_path, schema=schema)
+    # Buffer the per-file report and emit it with a single write instead of
+    # one syscall per line. Error blocks are buffered separately so each
+    # header stays adjacent to its details when written to stderr.
+    report = [f"{file_path}\n"]
+    err_report = []
+    errors = 0
+
+    try:
+        # The parse cache is shared with zuul_utils, so the object checks in
+        # main() reuse this parse instead of re-reading the file.
+        obj = zuul_utils.load_yaml_file(file_path)
+        if obj is None:
+            # Blank or comment-only files parse to None; treat them as
+            # trivially valid instead of walking the schema root.
+            return 0, "".join(report), ""
+        if validator.is_valid(obj):
+            # Valid files (the common case) skip the error-collecting
+            # descent of iter_errors entirely.
+            return 0, "".join(report), ""
+        va_errors = validator.iter_errors(obj)
+        for e in va_errors:
+            err_report.append(
+                f"\n{zuul_utils.MsgTypeColor.ERROR.value}Validation error:"
+                f"{zuul_utils.MsgTypeColor.RESET.value}\n"
+                f"File: {file_path}\n"
+                f"Message: {e.message}\n"
+                f"Path: {list(e.path)}\n"
+                f"Schema Path: {list(e.schema_path)}\n",
+            )
+            errors += 1
+            if fast_fail:
+                # Only the exit code matters; skip enumerating further errors
+                break
+    except yaml.YAMLError as e:
+        report.append(f"YAML Parse Error: {e}\n")
+        errors += 1
+    except FileNotFoundError as e:
+        sys.stdout.write("".join(report))
+        print(f"{e.filename} not found!\nExiting")
+        sys.exit(1)
 
+    return errors, "".join(report), "".join(err_report)
 
-def lint_all_yaml_files(file_paths: list[pathlib.Path], schema: dict) -> int:
+
+def lint_all_yaml_files(
+    file_paths: list[pathlib.Path],
+    schema: dict,
+    use_cache: bool = False,
+    fast_fail: bool = False,
+) -> int:
     """Lint all Zuul YAML files.
 
     Args:
     ----
         file_paths: A list of strings representing the paths to the YAML files to validate.
         schema: A JSON schema to validate against.
+        use_cache: Whether to reuse validation results cached on disk.
+        fast_fail: Whether to stop at the first validation error per file.
 
     Returns:
     -------
         The number of validation errors encountered.
     """
-    return sum(lint_single_yaml_file(file_path, schema) for file_path in file_paths)
+    results = {}
+    cache = None
+    cache_keys = {}
+    pending = list(file_paths)
+
+    if use_cache:
+        # Results are keyed on (schema digest, file digest), so both schema
+        # and file edits invalidate their entries automatically.
+        cache = shelve.open(str(_validation_cache_path()))  # noqa: S301
+        schema_digest = hashlib.blake2b(
+            json.dumps(schema, sort_keys=True).encode("utf-8"),
+        ).hexdigest()
+        pending = []
+        for file_path in file_paths:
+            try:
+                file_digest = hashlib.blake2b(pathlib.Path(file_path).read_bytes()).hexdigest()
+            except FileNotFoundError:
+                pending.append(file_path)
+                continue
+            # The path is part of the key because the cached reports embed
+            # it; two identical files must not replay each other's report.
+            key = f"{schema_digest}:{file_digest}:{file_path}:{int(fast_fail)}"
+            cache_keys[file_path] = key
+            if key in cache:
+                results[file_path] = cache[key]
+            else:
+                pending.append(file_path)
+
+    if len(pending) < MIN_FILES_FOR_POOL:
+        # Build the validator once; construction compiles schema state and is
+        # far more expensive than a single validation pass.
+        validator = _build_validator(schema)
+        for file_path in pending:
+            results[file_path] = lint(file_path, validator, fast_fail=fast_fail)
+    else:
+        # Each file is an independent parse + validation, so large runs are
+        # spread over a process pool. The initializer builds one validator per
+        # worker and chunking keeps the per-task IPC cost low.
+        max_workers = min(os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_lint_worker,
+            initargs=(schema, fast_fail),
+        ) as executor:
+            chunksize = max(1, len(pending) // (4 * max_workers))
+            results.update(
+                zip(pending, executor.map(_lint_worker, pending, chunksize=chunksize)),
+            )
+
+    if cache is not None:
+        for file_path in pending:
+            if file_path in cache_keys:
+                cache[cache_keys[file_path]] = results[file_path]
+        cache.close()
+
+    total_errors = 0
+    for file_path in file_paths:
+        errors, report, err_report = results[file_path]
+        sys.stdout.write(report)
+        if err_report:
+            sys.stderr.write(err_report)
+        total_errors += errors
+
+    return total_errors
 
 
 def lint_playbook_paths(zuul_yaml_files: list[pathlib.Path]) -> list[str]:
@@ -112,11 +292,12 @@ def lint_playbook_paths(zuul_yaml_files: list[pathlib.Path]) -> list[str]:
         A list of invalid playbook paths.
     """
     invalid_paths = []
+    job_key = ZuulObject.JOB.value
     for file_path in zuul_yaml_files:
         jobs = zuul_utils.get_zuul_object_from_yaml(ZuulObject.JOB, file_path)
         for job in jobs:
             invalid_paths.extend(
-                zuul_checker.check_job_playbook_paths(job.get(ZuulObject.JOB.value, {})),
+                zuul_checker.check_job_playbook_paths(job.get(job_key, {})),
             )
     return invalid_paths
 
@@ -133,35 +314,19 @@ def get_all_zuul_yaml_files(files: list[str]) -> list[pathlib.Path]:
         A list of Zuul YAML/YML files.
     """
     zuul_yaml_files = defaultdict(list)
+    seen = set()
     for file in files:
         for file_type, paths in zuul_utils.get_zuul_yaml_files(pathlib.Path(file)).items():
-            zuul_yaml_files[file_type].extend(paths)
+            for path in paths:
+                # Deduplicate so overlapping path arguments are linted once
+                resolved = path.resolve()
+                if resolved not in seen:
+                    seen.add(resolved)
+                    zuul_yaml_files[file_type].append(path)
 
     return zuul_yaml_files
 
 
-def get_all_zuul_objects_by_type(
-    zuul_yaml_files: list[pathlib.Path],
-    zuul_obj: ZuulObject,
-) -> list[dict]:
-    """Get all Zuul objects from provided Zuul YAML files.
-
-    Args:
-    ----
-        zuul_yaml_files: A list of Zuul YAML files.
-        zuul_obj: A ZuulObject enum.
-
-    Returns:
-    -------
-        A list of Zuul objects.
-    """
-    all_zuul_objects = []
-    for file_path in zuul_yaml_files:
-        zuul_objects = zuul_utils.get_zuul_object_from_yaml(zuul_obj, file_path)
-        all_zuul_objects.extend(zuul_objects)
-    return all_zuul_objects
-
-
 def print_warnings(
     warnings: dict,
     severity: MsgSeverity = MsgSeverity.WARNING,
@@ -278,8 +443,8 @@ def main():
     parser = argparse.ArgumentParser(prog="zuulcilint")
     parser.add_argument(
         "--version",
-        action="version",
-        version=importlib.metadata.version("zuulcilint"),
+        action=_LazyVersionAction,
+        help="show program's version number and exit",
     )
     parser.add_argument(
         "--check-playbook-paths",
@@ -295,6 +460,16 @@ def main():
         default=pathlib.Path(__file__).parent / "zuul-schema.json",
         type=pathlib.Path,
     )
+    parser.add_argument(
+        "--fast-fail",
+        help="stop validating a file at its first error",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--cache",
+        help="reuse validation results cached on disk for unchanged files",
+        action="store_true",
+    )
     parser.add_argument(
         "--ignore-warnings",
         "-i",
@@ -308,7 +483,15 @@ def main():
     )
 
     args = parser.parse_args()
+    if zuul_utils.SafeLoader is yaml.SafeLoader:
+        print(
+            "libyaml not available, falling back to the slower pure-Python "
+            "YAML loader (pip install pyyaml with libyaml to fix)",
+            file=sys.stderr,
+        )
     schema = zuul_utils.get_zuul_schema(schema_file=args.schema)
+    # Fail fast on a broken schema instead of erroring on the first file
+    Draft201909Validator.check_schema(schema)
     all_zuul_yaml_files = get_all_zuul_yaml_files(args.file)
     zuul_good_yaml = all_zuul_yaml_files["good_yaml"]
     zuul_bad_yaml = all_zuul_yaml_files["bad_yaml"]
@@ -324,7 +507,12 @@ def main():
     }
 
     # Lint all Zuul YAML files
-    results["errors"]["yaml"] = lint_all_yaml_files(zuul_good_yaml, schema)
+    results["errors"]["yaml"] = lint_all_yaml_files(
+        zuul_good_yaml,
+        schema,
+        use_cache=args.cache,
+        fast_fail=args.fast_fail,
+    )
 
     # Check playbook paths if specified
     if args.check_playbook_paths:
@@ -338,13 +526,16 @@ def main():
         else:
             print("No invalid playbook paths")
 
+    # Group all Zuul objects by type in a single pass over the parsed files
+    grouped = zuul_utils.group_zuul_objects_by_type(zuul_good_yaml)
+    all_jobs = [job for jobs in grouped[ZuulObject.JOB].values() for job in jobs]
+    all_nodesets = [
+        nodeset for nodesets in grouped[ZuulObject.NODESET].values() for nodeset in nodesets
+    ]
+
     # Check duplicated jobs
     zuul_utils.print_bold("Checking for duplicate jobs", MsgSeverity.INFO)
-    jobs_dict = {}
-    for yaml_file in zuul_good_yaml:
-        jobs_dict[yaml_file] = get_all_zuul_objects_by_type([yaml_file], ZuulObject.JOB)
-
-    duplicated_jobs = zuul_checker.check_duplicated_jobs(jobs_dict)
+    duplicated_jobs = zuul_checker.check_duplicated_jobs(grouped[ZuulObject.JOB])
 
     if duplicated_jobs:
         for job in duplicated_jobs:
@@ -356,8 +547,8 @@ def main():
     # Check for inexistent nodesets
     zuul_utils.print_bold("Checking for inexistent nodesets", MsgSeverity.INFO)
     inexistent_nodesets = zuul_checker.check_inexistent_nodesets(
-        get_all_zuul_objects_by_type(zuul_good_yaml, ZuulObject.NODESET),
-        get_all_zuul_objects_by_type(zuul_good_yaml, ZuulObject.JOB),
+        all_nodesets,
+        all_jobs,
     )
     if inexistent_nodesets:
         for nodeset in inexistent_nodesets:
@@ -368,9 +559,7 @@ def main():
 
     # Check for duplicate semaphore in job and job.run
     zuul_utils.print_bold("Checking for duplicate semaphore", MsgSeverity.INFO)
-    duplicate_semaphore = zuul_checker.check_duplicate_semaphore(
-        get_all_zuul_objects_by_type(zuul_good_yaml, ZuulObject.JOB),
-    )
+    duplicate_semaphore = zuul_checker.check_duplicate_semaphore(all_jobs)
     if duplicate_semaphore:
         for semaphore in duplicate_semaphore:
             print(f"{semaphore}")
@@ -2,7 +2,55 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import pathlib
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from itertools import chain
+
+
+# Job keys that may carry playbook paths
+_PLAYBOOK_KEYS = ("pre-run", "run", "post-run", "cleanup-run")
+
+
+@functools.lru_cache(maxsize=1024)
+def _dir_entries(parent: str) -> frozenset[str]:
+    """List the entry names of a directory, cached per run.
+
+    Args:
+    ----
+        parent: The directory to list.
+
+    Returns:
+    -------
+        A frozenset of entry names, empty when the directory cannot be read.
+    """
+    try:
+        with os.scandir(parent or ".") as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _path_exists(path: str) -> bool:
+    """Check whether a path exists using the cached directory listings.
+
+    Batches existence checks into one scandir per directory instead of one
+    stat per candidate path.
+
+    Args:
+    ----
+        path: The path to check.
+
+    Returns:
+    -------
+        True if the path exists.
+    """
+    parent, name = os.path.split(path)
+    if not name:
+        return pathlib.Path(path).exists()
+    return name in _dir_entries(parent)
 
 
 def check_job_playbook_paths(job: dict[str, dict | list[str | dict]]) -> list[str]:
@@ -18,7 +66,7 @@ def check_job_playbook_paths(job: dict[str, dict | list[str | dict]]) -> list[st
     """
     invalid_paths = []
 
-    for key in ["pre-run", "run", "post-run", "cleanup-run"]:
+    for key in _PLAYBOOK_KEYS:
         paths = job.get(key)
         if paths is None:
             continue
@@ -28,13 +76,10 @@ def check_job_playbook_paths(job: dict[str, dict | list[str | dict]]) -> list[st
             paths = [paths]
 
         for path in paths:
-            if isinstance(path, str):
-                if not pathlib.Path(path).exists():
-                    invalid_paths.append(path)
             if isinstance(path, dict):
-                if "name" in path:
-                    if not pathlib.Path(path["name"]).exists():
-                        invalid_paths.append(path["name"])
+                path = path.get("name")  # noqa: PLW2901
+            if isinstance(path, str) and not _path_exists(path):
+                invalid_paths.append(path)
 
     return invalid_paths
 
@@ -52,22 +97,18 @@ def check_duplicated_jobs(
     -------
         A set of duplicated jobs.
     """
-    seen_items = set()
-    duplicated_items = set()
-    unique_items = set()
-
-    for joblist in jobs.values():
-        try:
-            sublist_set = set(job["job"]["name"] for job in joblist)
-        except KeyError:
-            continue
-        for job in sublist_set:
-            if job in seen_items:
-                duplicated_items.add(job)
-            seen_items.add(job)
-        unique_items.update(sublist_set)
+    # Fewer than two jobs can't contain a duplicate.
+    if sum(len(joblist) for joblist in jobs.values()) < 2:
+        return set()
+
+    # Deduplicate per file so only cross-file repeats count.
+    per_file_names = (
+        {job["job"]["name"] for job in joblist if "name" in job.get("job", ())}
+        for joblist in jobs.values()
+    )
 
-    return duplicated_items
+    counts = Counter(chain.from_iterable(per_file_names))
+    return {name for name, count in counts.items() if count > 1}
 
 
 def check_inexistent_nodesets(
@@ -87,41 +128,81 @@ def check_inexistent_nodesets(
     """
     nodeset_list = set()
     for nodeset in nodesets:
-        nodeset_list.add(nodeset["nodeset"]["name"])
-        try:
-            node_list = nodeset["nodeset"]["nodes"]
-        except KeyError:
-            continue
-        for node in node_list:
-            if isinstance(node["name"], str):
-                nodeset_list.add(node["name"])
-            if isinstance(node["name"], list):
-                for node_name in node["name"]:
-                    nodeset_list.add(node_name)
-    inexistent_nodesets = set()
+        body = nodeset["nodeset"]
+        nodeset_list.add(body["name"])
+        for node in body.get("nodes", ()):
+            node_name = node["name"]
+            if isinstance(node_name, str):
+                nodeset_list.add(node_name)
+            elif isinstance(node_name, list):
+                nodeset_list.update(node_name)
+    # Collect every referenced name with explicit branches (no exception
+    # control flow), then resolve with a single C-level set difference.
+    referenced = set()
 
     for job in jobs:
-        try:
-            if isinstance(job["job"]["nodeset"], str):
-                nodeset = {}
-                nodeset["name"] = job["job"]["nodeset"]
-                job_nodesets = [nodeset]
-            else:
-                job_nodesets = job["job"]["nodeset"]["nodes"]
-        except KeyError:
+        if not job:
             continue
-        for nodeset in job_nodesets:
-            try:
-                if nodeset["name"] not in nodeset_list:
-                    inexistent_nodesets.add(nodeset["name"])
-            except TypeError:
-                if (
-                    job_nodesets.get("name", None)
-                    and job_nodesets.get("name", None) not in nodeset_list
-                ):
-                    inexistent_nodesets.add(job_nodesets["name"])
+        nodeset = job.get("job", {}).get("nodeset")
+        if isinstance(nodeset, str):
+            referenced.add(nodeset)
+        elif isinstance(nodeset, dict):
+            nodes = nodeset.get("nodes")
+            if isinstance(nodes, dict):
+                # A single node entry given as a mapping
+                nodes = [nodes]
+            for node in nodes or ():
+                if isinstance(node, dict):
+                    name = node.get("name")
+                    if name:
+                        referenced.add(name)
+
+    return referenced - nodeset_list
+
+
+def _iter_job_semaphores(job: dict) -> Iterator[str]:
+    """Yield semaphore names declared at the job level.
 
-    return inexistent_nodesets
+    Args:
+    ----
+        job: The contents of a Zuul job entry.
+
+    Yields:
+    ------
+        The semaphore names, whether declared as a string or a list.
+    """
+    semaphores = job.get("semaphores", [])
+    if isinstance(semaphores, str):
+        yield semaphores
+    else:
+        yield from semaphores
+
+
+def _iter_run_semaphores(job: dict) -> Iterator[str]:
+    """Yield semaphore names declared on the job's run entries.
+
+    Args:
+    ----
+        job: The contents of a Zuul job entry.
+
+    Yields:
+    ------
+        The semaphore names, whether declared as a string or a list.
+    """
+    run_entries = job.get("run", [])
+    if isinstance(run_entries, str):
+        # When the run entry is a string this means it's a playbook
+        return
+    if isinstance(run_entries, dict):  # Single run entry case
+        run_entries = [run_entries]
+    for run in run_entries:
+        if isinstance(run, str):
+            continue
+        semaphores = run.get("semaphores", [])
+        if isinstance(semaphores, str):
+            yield semaphores
+        else:
+            yield from semaphores
 
 
 def check_duplicate_semaphore(jobs: list[dict | None]) -> set[dict[str, str] | None]:
@@ -137,50 +218,23 @@ def check_duplicate_semaphore(jobs: list[dict | None]) -> set[dict[str, str] | N
         A set of duplicated semaphores.
     """
     duplicate_semaphores = set()
-    _job_semaphore_list = {}
-    _run_semaphore_list = {}
+    _job_semaphores = defaultdict(set)
+    _run_semaphores = defaultdict(set)
 
     for job in jobs:
         if job is None or "job" not in job:
             continue
 
-        job_name = job["job"].get("name")
+        job_body = job["job"]
+        job_name = job_body.get("name")
         if job_name is None:
             continue
 
-        # Initialize lists for semaphores if not already present
-        _job_semaphore_list.setdefault(job_name, [])
-        _run_semaphore_list.setdefault(job_name, [])
-
-        # Collect job semaphores
-        job_semaphores = job["job"].get("semaphores", [])
-        if isinstance(job_semaphores, str):
-            _job_semaphore_list[job_name].append(job_semaphores)
-        else:
-            _job_semaphore_list[job_name].extend(job_semaphores)
-
-        # Collect run semaphores
-        if isinstance(job["job"].get("run"), str):
-            continue
-        else:
-            run_entries = job["job"].get("run", [])
-        if isinstance(run_entries, dict):  # Single run entry case
-            run_entries = [run_entries]
-        for run in run_entries:
-            if isinstance(run, str):
-                # When run entry is a string this means it's a playbook
-                continue
-            else:
-                run_semaphores = run.get("semaphores", [])
-            if isinstance(run_semaphores, str):
-                _run_semaphore_list[job_name].append(run_semaphores)
-            else:
-                _run_semaphore_list[job_name].extend(run_semaphores)
+        _job_semaphores[job_name].update(_iter_job_semaphores(job_body))
+        _run_semaphores[job_name].update(_iter_run_semaphores(job_body))
 
     # Find duplicate semaphores
-    for job_name in _job_semaphore_list.keys():
-        job_semaphores_set = set(_job_semaphore_list[job_name])
-        run_semaphores_set = set(_run_semaphore_list[job_name])
-        duplicate_semaphores.update(job_semaphores_set & run_semaphores_set)
+    for job_name, job_semaphores in _job_semaphores.items():
+        duplicate_semaphores.update(job_semaphores & _run_semaphores[job_name])
 
     return duplicate_semaphores
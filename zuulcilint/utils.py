@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import pathlib
 import sys
 from collections import defaultdict
@@ -10,6 +12,11 @@ from enum import Enum
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class MsgSeverity(Enum):
     """Enum for message severity."""
@@ -45,6 +52,38 @@ class ZuulObject(Enum):
     TEMPLATE = "project-template"
 
 
+# Job keys that may carry playbook paths
+_PLAYBOOK_PATH_KEYS = ("pre-run", "run", "post-run")
+
+# Color and to-stderr flag per message severity, resolved with one dict
+# lookup in print_bold instead of an if/elif chain per call.
+_SEVERITY_STYLES = {
+    MsgSeverity.ERROR: (MsgTypeColor.ERROR.value, True),
+    MsgSeverity.WARNING: (MsgTypeColor.WARNING.value, False),
+    MsgSeverity.INFO: (MsgTypeColor.INFO.value, False),
+    MsgSeverity.SUCCESS: (MsgTypeColor.SUCCESS.value, False),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schema_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse a JSON schema file, cached on path and modification time.
+
+    Args:
+    ----
+        path_str: The path to the JSON schema file.
+        mtime_ns: The file's modification time in nanoseconds, used as part of
+            the cache key so rewritten files are re-parsed.
+
+    Returns:
+    -------
+        A dictionary representing the schema.
+    """
+    # json.loads sniffs the encoding itself, so reading bytes skips the
+    # Python-level text decode of a file handle.
+    return json.loads(pathlib.Path(path_str).read_bytes())
+
+
 def get_zuul_schema(schema_file: str) -> dict:
     """Load the Zuul schema from a JSON file.
 
@@ -57,8 +96,8 @@ def get_zuul_schema(schema_file: str) -> dict:
         A dictionary representing the Zuul schema.
     """
     try:
-        with pathlib.Path.open(schema_file, encoding="utf-8") as f:
-            return json.load(f)
+        mtime_ns = os.stat(schema_file).st_mtime_ns
+        return _load_schema_cached(str(schema_file), mtime_ns)
     except FileNotFoundError:
         print(f"Schema file not found: {schema_file}", file=sys.stderr)
         sys.exit(1)
@@ -83,21 +122,110 @@ def get_zuul_yaml_files(path: pathlib.Path) -> dict[str, list[pathlib.Path]]:
     zuul_yaml_files = defaultdict(list)
 
     if path.is_file():
-        if path.suffix == ".yaml":
+        suffix = path.suffix.lower()
+        if suffix == ".yaml":
             zuul_yaml_files["good_yaml"].append(path)
-        elif path.suffix == ".yml":
+        elif suffix == ".yml":
             zuul_yaml_files["bad_yaml"].append(path)
     elif path.is_dir():
-        for p in path.iterdir():
-            for file_type, yaml_file_path in get_zuul_yaml_files(p).items():
-                zuul_yaml_files[file_type].extend(yaml_file_path)
-
+        # Walk iteratively with os.scandir: DirEntry caches the file type,
+        # so no extra stat() call is made per directory entry.
+        dirs = [str(path)]
+        while dirs:
+            with os.scandir(dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                        continue
+                    name = entry.name.lower()
+                    if name.endswith(".yaml"):
+                        zuul_yaml_files["good_yaml"].append(pathlib.Path(entry.path))
+                    elif name.endswith(".yml"):
+                        zuul_yaml_files["bad_yaml"].append(pathlib.Path(entry.path))
     else:
         print(f"Skipping {path}")
 
     return zuul_yaml_files
 
 
+@functools.lru_cache(maxsize=128)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> list | dict | None:
+    """Parse a YAML file, cached on path and modification time.
+
+    Args:
+    ----
+        path_str: The path to the YAML file.
+        mtime_ns: The file's modification time in nanoseconds, used as part of
+            the cache key so rewritten files are re-parsed.
+
+    Returns:
+    -------
+        The object loaded from the YAML file.
+    """
+    # Feed raw bytes to the loader so libyaml handles UTF-8 decoding in C
+    # instead of going through PyYAML's Python-level stream reader.
+    return yaml.load(pathlib.Path(path_str).read_bytes(), Loader=SafeLoader)
+
+
+def load_yaml_file(path: str | pathlib.Path) -> list | dict | None:
+    """Load a YAML file through the shared mtime-keyed parse cache.
+
+    Args:
+    ----
+        path: The path to the YAML file.
+
+    Returns:
+    -------
+        The object loaded from the YAML file.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    return _load_yaml_cached(str(path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_yaml_scalars(path_str: str, mtime_ns: int) -> frozenset[str]:
+    """Collect the scalar values of a YAML file by streaming parse events.
+
+    This is a cheap superset probe: if an object kind does not appear in the
+    result, the file cannot contain a matching top-level key and the full
+    document build can be skipped.
+
+    Args:
+    ----
+        path_str: The path to the YAML file.
+        mtime_ns: The file's modification time in nanoseconds, used as part of
+            the cache key so rewritten files are re-scanned.
+
+    Returns:
+    -------
+        A frozenset of all scalar values found in the file.
+    """
+    return frozenset(
+        event.value
+        for event in yaml.parse(pathlib.Path(path_str).read_bytes(), Loader=SafeLoader)
+        if isinstance(event, yaml.events.ScalarEvent)
+    )
+
+
+def filter_zuul_objects(
+    obj_type: ZuulObject,
+    zuul_objects: list[dict | None],
+) -> list[dict[str, str] | None]:
+    """Filter already-parsed Zuul documents for the specified object type.
+
+    Args:
+    ----
+        obj_type: The type of object to search for.
+        zuul_objects: A list of parsed top-level Zuul entries.
+
+    Returns:
+    -------
+        A list of dictionaries representing the Zuul objects found.
+    """
+    obj_key = obj_type.value
+    return [obj for obj in zuul_objects if obj.get(obj_key)]
+
+
 def get_zuul_object_from_yaml(
     obj_type: ZuulObject,
     zuul_yaml_file: str,
@@ -114,8 +242,10 @@ def get_zuul_object_from_yaml(
         A list of dictionaries representing the Zuul objects found.
     """
     try:
-        with pathlib.Path.open(zuul_yaml_file, encoding="utf-8") as f:
-            return [obj for obj in yaml.safe_load(f) if obj.get(obj_type.value)]
+        mtime_ns = os.stat(zuul_yaml_file).st_mtime_ns
+        if obj_type.value not in _scan_yaml_scalars(str(zuul_yaml_file), mtime_ns):
+            return []
+        return filter_zuul_objects(obj_type, _load_yaml_cached(str(zuul_yaml_file), mtime_ns))
     except FileNotFoundError:
         print(f"Zuul YAML file not found: {zuul_yaml_file}", file=sys.stderr)
         sys.exit(1)
@@ -127,6 +257,50 @@ def get_zuul_object_from_yaml(
         sys.exit(1)
 
 
+def group_zuul_objects_by_type(
+    zuul_yaml_files: list[pathlib.Path],
+) -> dict[ZuulObject, dict[pathlib.Path, list[dict]]]:
+    """Classify the Zuul objects of all provided files in a single pass.
+
+    Each file is parsed once and its top-level entries are grouped by object
+    type, replacing one traversal per (file, type) combination.
+
+    Args:
+    ----
+        zuul_yaml_files: A list of Zuul YAML files.
+
+    Returns:
+    -------
+        A dictionary mapping each ZuulObject to a per-file dictionary of the
+        objects found.
+    """
+    grouped = {obj_type: {} for obj_type in ZuulObject}
+    key_to_type = {obj_type.value: obj_type for obj_type in ZuulObject}
+
+    for file_path in zuul_yaml_files:
+        per_file = {obj_type: [] for obj_type in ZuulObject}
+        try:
+            # Blank or comment-only files parse to None; like lint(), treat
+            # them as containing no objects rather than as invalid.
+            for obj in load_yaml_file(file_path) or ():
+                for key, value in obj.items():
+                    if value and key in key_to_type:
+                        per_file[key_to_type[key]].append(obj)
+        except FileNotFoundError:
+            print(f"Zuul YAML file not found: {file_path}", file=sys.stderr)
+            sys.exit(1)
+        except yaml.YAMLError:
+            print(f"Invalid YAML in Zuul YAML file: {file_path}", file=sys.stderr)
+            sys.exit(1)
+        except (AttributeError, TypeError):
+            print(f"Invalid Zuul YAML file detected: {file_path}", file=sys.stderr)
+            sys.exit(1)
+        for obj_type, objs in per_file.items():
+            grouped[obj_type][file_path] = objs
+
+    return grouped
+
+
 def get_playbook_paths_from_job(job: dict[str, str] | None) -> list[str | None]:
     """Retrieve a list of playbook paths from the specified job.
 
@@ -138,9 +312,7 @@ def get_playbook_paths_from_job(job: dict[str, str] | None) -> list[str | None]:
     -------
         A list of playbook paths.
     """
-    path_keys = ["pre-run", "run", "post-run"]
-
-    return [job.get(key) for key in path_keys if job.get(key)]
+    return [value for value in (job.get(key) for key in _PLAYBOOK_PATH_KEYS) if value]
 
 
 def get_files_with_extension(path: str, extension: str) -> list[pathlib.Path]:
@@ -155,7 +327,24 @@ def get_files_with_extension(path: str, extension: str) -> list[pathlib.Path]:
     -------
         A list of files with provided extension.
     """
-    return list(pathlib.Path(path).rglob(f"*.{extension}"))
+    suffix = f".{extension}"
+    files = []
+
+    if not pathlib.Path(path).is_dir():
+        return files
+
+    # Same iterative os.scandir walk as get_zuul_yaml_files: DirEntry caches
+    # the file type, so no extra stat() call is made per directory entry.
+    dirs = [str(path)]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    files.append(pathlib.Path(entry.path))
+
+    return files
 
 
 def encrypted_pkcs1_oaep_constructor(loader: yaml.SafeLoader, node: yaml.Node) -> str | list:
@@ -235,13 +424,12 @@ def print_bold(msg: str, msg_type: MsgSeverity) -> None:
     -------
         None.
     """
-    if msg_type == MsgSeverity.ERROR:
-        print(f"\n{MsgTypeColor.ERROR.value}{msg}{MsgTypeColor.RESET.value}", file=sys.stderr)
-    elif msg_type == MsgSeverity.WARNING:
-        print(f"\n{MsgTypeColor.WARNING.value}{msg}{MsgTypeColor.RESET.value}")
-    elif msg_type == MsgSeverity.INFO:
-        print(f"\n{MsgTypeColor.INFO.value}{msg}{MsgTypeColor.RESET.value}")
-    elif msg_type == MsgSeverity.SUCCESS:
-        print(f"\n{MsgTypeColor.SUCCESS.value}{msg}{MsgTypeColor.RESET.value}")
-    else:
+    style = _SEVERITY_STYLES.get(msg_type)
+    if style is None:
         print(f"{MsgTypeColor.DEFAULT.value}{msg}{MsgTypeColor.RESET.value}")
+        return
+    color, to_stderr = style
+    print(
+        f"\n{color}{msg}{MsgTypeColor.RESET.value}",
+        file=sys.stderr if to_stderr else sys.stdout,
+    )